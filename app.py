@@ -1,7 +1,10 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # Page configuration
 st.set_page_config(
@@ -13,11 +16,27 @@ st.set_page_config(
 # Title and description
 st.title("NRL Player Efforts")
 
+# Stats that can be counted as efforts
+available_stats = ['runs', 'kickPressures', 'kicksDefused', 'supports', 'decoys', 'tackles']
+
+# Above this many player-rounds the individual games plot is drawn as a
+# 2-D histogram rather than as individual points
+max_scatter_points = 20000
+
 # Function to load and prepare data
 @st.cache_data
 def load_data():
-    # Load data
-    df = pd.read_csv('round_players.csv')
+    # Load data (only the columns the app uses; see convert_data.py)
+    df = pd.read_parquet(
+        'round_players.parquet',
+        columns=['playerName', 'teamId', 'positionName', 'roundNumber', 'mins'] + available_stats
+    )
+
+    # Downcast the numeric columns (rounds, minutes and stat counts are small).
+    # Aggregates of these columns are widened again below
+    df['roundNumber'] = df['roundNumber'].astype('int16')
+    for col in ['mins'] + available_stats:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
 
     # Create team name mapping
     team_name_mapping = {
@@ -43,24 +62,373 @@ def load_data():
     # Add team name column
     df['teamName'] = df['teamId'].map(team_name_mapping)
 
-    # Calculate season totals per player
-    player_totals = df.groupby(['playerName', 'teamName', 'positionName']).agg({
+    # Store repeated names as categoricals so filters and groupbys work on integer codes
+    for col in ['teamName', 'positionName', 'playerName']:
+        df[col] = df[col].astype('category')
+
+    # Calculate season totals per player, including each effort stat
+    player_totals = df.groupby(['playerName', 'teamName', 'positionName'], observed=True).agg({
         'mins': 'sum',
-        'roundNumber': 'count'
+        'roundNumber': 'count',
+        **{stat: 'sum' for stat in available_stats}
     }).reset_index()
     player_totals.rename(columns={'roundNumber': 'gamesPlayed', 'mins': 'totalMins'}, inplace=True)
 
-    return df, player_totals
+    # groupby keeps the downcast int8 dtype for sums that still fit, so widen
+    # the totals before any further arithmetic on them
+    player_totals = player_totals.astype({col: 'int64' for col in ['totalMins'] + available_stats})
+
+    # Lowercase player names once (Arrow-backed) for the player name searches
+    df['playerNameLower'] = df['playerName'].str.lower().astype('string[pyarrow]')
+    player_totals['playerNameLower'] = player_totals['playerName'].str.lower().astype('string[pyarrow]')
+
+    # Stack the effort stats into one contiguous float32 matrix (one column per stat)
+    stats_mat = np.ascontiguousarray(df[available_stats].to_numpy(dtype=np.float32))
+
+    # Index of each player's row positions, so a player filter is a gather
+    player_rows = {
+        player: rows.astype(np.int32)
+        for player, rows in df.groupby('playerName', observed=True).indices.items()
+    }
+
+    return df, player_totals, stats_mat, player_rows
+
+
+# Function to sum the selected stats for every player-round combination
+@st.cache_data
+def compute_efforts(stats):
+    _, _, stats_mat, _ = load_data()
+
+    # One matrix-vector product over the whole contiguous matrix with a
+    # 0/1 selector over the stats, shared by every filter combination.
+    # Stat counts sum exactly in float32, so cast back to whole efforts
+    selector = np.isin(available_stats, stats).astype(np.float32)
+    return (stats_mat @ selector).astype(np.int64)
+
+
+# Function to build a row mask for the selected values of a categorical column
+def category_mask(column, values):
+    # Lookup table over the categories (plus False for missing, code -1),
+    # indexed by each row's integer code
+    lookup = np.append(column.cat.categories.isin(values), False)
+    return lookup[column.cat.codes.to_numpy()]
+
+
+# Function to build the row mask for the position, team and player filters
+def selection_mask(frame, positions, teams, players):
+    mask = category_mask(frame['positionName'], positions)
+    mask &= category_mask(frame['teamName'], teams)
+
+    # Further filter if players are selected
+    if players:
+        mask &= category_mask(frame['playerName'], players)
+
+    return mask
+
+
+# Function to filter the data and aggregate the selected stats
+@st.cache_data
+def compute_views(positions, teams, players, stats):
+    df, player_totals, _, player_rows = load_data()
+
+    # Find the rows matching the selections, starting from the selected
+    # players' rows if any, otherwise from all rows
+    if players:
+        rows = np.sort(np.concatenate([player_rows[player] for player in players]))
+        rows = rows[selection_mask(df[['positionName', 'teamName']].take(rows), positions, teams, ())]
+    else:
+        rows = np.flatnonzero(selection_mask(df, positions, teams, ()))
+
+    # Gather the filtered player-rounds once and add their efforts (take()
+    # returns a new frame, so the column is set without a defensive copy)
+    filtered_df = df.take(rows)
+    filtered_df['efforts'] = compute_efforts(stats)[rows]
+
+    # Player season totals are already grouped by player, team and position,
+    # so select the matching players and add up their selected stat totals
+    season_totals = player_totals[selection_mask(player_totals, positions, teams, players)]
+    player_season_stats = season_totals[
+        ['playerName', 'playerNameLower', 'teamName', 'positionName', 'totalMins', 'gamesPlayed']
+    ].assign(
+        efforts=season_totals[available_stats].to_numpy(dtype=np.int64) @ np.isin(available_stats, stats)
+    ).reset_index(drop=True)
+
+    # Calculate the stats per minute
+    player_season_stats['efforts_per_min'] = (player_season_stats['efforts'] / player_season_stats['totalMins'])
+
+    return filtered_df, player_season_stats
+
+
+# Function to match a search term against the lowercase player names
+def player_name_contains(frame, search_term):
+    matches = pc.match_substring(pa.array(frame['playerNameLower'].array), search_term.lower())
+    return matches.to_numpy(zero_copy_only=False)
 
 
-# Load data
-df, player_totals = load_data()
+# Function to build the sidebar filter options
+@st.cache_data
+def load_filter_options():
+    df, player_totals, _, _ = load_data()
+
+    # Categories are already the sorted unique values
+    all_positions = df['positionName'].cat.categories.tolist()
+    all_teams = df['teamName'].cat.categories.tolist()
+
+    # Players for each (position, team) combination
+    players_by_group = {
+        group: players.tolist()
+        for group, players in player_totals.groupby(['positionName', 'teamName'], observed=True)['playerName']
+    }
+
+    return all_positions, all_teams, players_by_group
+
+
+# Function to build a scatter plot with one trace per position, using
+# graph_objects directly rather than Plotly Express
+def position_scatter(data, x, y, hover_data, labels, size=None, size_max=15, webgl=False):
+    scatter = go.Scattergl if webgl else go.Scatter
+
+    # Hover shows the position, x, y and marker size first, as Plotly Express does
+    hover_data = [col for col in hover_data if col not in ('positionName', x, y, size)]
+    if size is not None:
+        hover_data = [size] + hover_data
+    hover_lines = [f"{labels.get(x, x)}=%{{x}}", f"{labels.get(y, y)}=%{{y}}"] + [
+        f"{labels.get(col, col)}=%{{customdata[{i}]}}" for i, col in enumerate(hover_data)
+    ]
+
+    positions = data['positionName'].unique().tolist()
+    rows_by_position = data.groupby('positionName', observed=True).indices
+    x_values = data[x].to_numpy()
+    y_values = data[y].to_numpy()
+    names = data['playerName'].to_numpy()
+    custom = data[hover_data].to_numpy()
+    if size is not None:
+        sizes = data[size].to_numpy()
+        sizeref = sizes.max() / size_max ** 2 if len(sizes) else 1
+
+    traces = []
+    for position in positions:
+        rows = rows_by_position[position]
+        marker = dict(size=sizes[rows], sizemode='area', sizeref=sizeref) if size is not None else {}
+        traces.append(scatter(
+            name=position,
+            legendgroup=position,
+            mode='markers',
+            x=x_values[rows],
+            y=y_values[rows],
+            hovertext=names[rows],
+            customdata=custom[rows],
+            marker=marker,
+            hovertemplate=(
+                f"<b>%{{hovertext}}</b><br><br>positionName={position}<br>"
+                + "<br>".join(hover_lines) + "<extra></extra>"
+            )
+        ))
+
+    # Legend spacing and symbol sizing as Plotly Express sets them
+    fig = go.Figure(traces)
+    fig.update_layout(legend=dict(tracegroupgap=0))
+    if size is not None:
+        fig.update_layout(legend=dict(itemsizing='constant'))
+
+    return fig
+
+
+# Function to build the individual games plot as a 2-D histogram of
+# player-rounds, with each position's median game overlaid
+def games_density_figure(filtered_df):
+    counts, x_edges, y_edges = np.histogram2d(filtered_df['mins'], filtered_df['efforts'], bins=(80, 80))
+
+    # Log-scale the counts, leaving empty bins blank
+    log_counts = np.log10(counts, where=counts > 0, out=np.full_like(counts, np.nan))
+
+    fig = px.imshow(
+        log_counts.T,
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        origin='lower',
+        aspect='auto',
+        color_continuous_scale='Viridis',
+        labels={'x': 'Mins', 'y': 'Efforts', 'color': 'log10(Games)'}
+    )
+
+    # Hover shows the number of games in each bin rather than its log
+    fig.update_traces(
+        customdata=counts.T.astype(np.int64),
+        hovertemplate="Mins=%{x}<br>Efforts=%{y}<br>Games=%{customdata}<extra></extra>"
+    )
+
+    # Overlay each position's median game
+    medians = filtered_df.groupby('positionName', observed=True)[['mins', 'efforts']].median()
+    fig.add_trace(go.Scatter(
+        x=medians['mins'],
+        y=medians['efforts'],
+        text=medians.index,
+        mode='markers+text',
+        textposition='top center',
+        marker=dict(color='white', line=dict(color='black', width=1)),
+        showlegend=False
+    ))
+
+    return fig
+
+
+# Function to build the individual games plot
+def games_figure(filtered_df):
+    # Too many points overlap to be worth drawing one by one, so show density
+    if len(filtered_df) > max_scatter_points:
+        fig1 = games_density_figure(filtered_df)
+    else:
+        # Create the scatter plot (WebGL, as this grows with rounds x players).
+        # This is the only WebGL chart on the page: the other plots are SVG and
+        # only one plot view is drawn at a time, so the page stays well under the
+        # browser's limit on live WebGL contexts. Keep it that way when adding
+        # charts, or they will need to share a single canvas
+        fig1 = position_scatter(
+            filtered_df.astype({'mins': 'float32', 'efforts': 'float32'}),
+            x='mins',
+            y='efforts',
+            hover_data=['positionName', 'teamName', 'roundNumber', 'mins'],
+            labels={'mins': 'Mins', 'efforts': f'Efforts'},
+            webgl=True
+        )
+        fig1.update_layout(legend_title="Position")
+
+    x_max_1 = filtered_df['mins'].max()
+
+    # Add y = x line
+    fig1.update_layout(shapes=[dict(
+        type="line",
+        x0=0, y0=0,
+        x1=x_max_1, y1=x_max_1,
+        line=dict(color="black", dash="dash"),
+    )])
+
+    # Update the layout
+    fig1.update_layout(
+        height=600,
+        xaxis_title="Minutes Played",
+        yaxis_title=f"Number of Efforts"
+    )
+
+    return fig1
+
+
+# Function to build the season totals scatter plot
+def season_total_figure(player_season_stats):
+    # Create the scatter plot for season totals
+    fig2 = position_scatter(
+        player_season_stats,
+        x='totalMins',
+        y='efforts',
+        hover_data=['teamName', 'gamesPlayed', 'totalMins', 'efforts'],
+        labels={'totalMins': 'Total Mins', 'efforts': f'Total Efforts'},
+        size='gamesPlayed',  # Size points by games played
+        size_max=15  # Maximum marker size
+    )
+
+    x_max_2 = player_season_stats['totalMins'].max()
+
+    # Add y = x line
+    fig2.update_layout(shapes=[dict(
+        type="line",
+        x0=0, y0=0,
+        x1=x_max_2, y1=x_max_2,
+        line=dict(color="black", dash="dash"),
+    )])
+
+    # Update the layout
+    fig2.update_layout(
+        height=600,
+        xaxis_title="Total Minutes Played",
+        yaxis_title=f"Total Efforts",
+        legend_title="Position"
+    )
+
+    return fig2
+
+
+# Function to build the season efficiency scatter plot
+def season_efficiency_figure(player_season_stats):
+    # Create the scatter plot for efficiency
+    fig3 = position_scatter(
+        player_season_stats,
+        x='totalMins',
+        y='efforts_per_min',
+        hover_data=['teamName', 'gamesPlayed', 'totalMins', 'efforts', 'efforts_per_min'],
+        labels={'totalMins': 'Total Minutes Played', 'efforts_per_min': f'Efforts per Minute'},
+        size='gamesPlayed',  # Size points by games played
+        size_max=15  # Maximum marker size
+    )
+
+    x_max_3 = player_season_stats['totalMins'].max()
+
+    # Add y = x line
+    fig3.update_layout(shapes=[dict(
+        type="line",
+        x0=0, y0=1,
+        x1=x_max_3, y1=1,
+        line=dict(color="black", dash="dash"),
+    )])
+
+    # Update the layout
+    fig3.update_layout(
+        height=600,
+        xaxis_title="Total Minutes Played",
+        yaxis_title=f"Efforts Per Minute",
+        legend_title="Position"
+    )
+
+    return fig3
+
+
+# Function to build a plot's figure, cached per filter selection and plot.
+# A cache hit skips building the figure, but unpickling it and the JSON
+# serialization in st.plotly_chart still run on every rerun (together
+# under half the cost of a build for the games plot)
+@st.cache_data
+def build_figure(view_key, which):
+    filtered_df, player_season_stats = compute_views(*view_key)
+
+    if which == 'games':
+        return games_figure(filtered_df)
+    elif which == 'season_total':
+        return season_total_figure(player_season_stats)
+    else:
+        return season_efficiency_figure(player_season_stats)
+
+
+# Function to pick the top k rows by a column without sorting the whole frame
+def top_k(frame, column, k=10):
+    values = frame[column].to_numpy()
+    if len(values) > k:
+        # Keep every row tying the k-th largest value, so the stable sort
+        # below resolves ties in the frame's (alphabetical) row order
+        kth = np.partition(values, len(values) - k)[len(values) - k]
+        frame = frame[values >= kth]
+    return frame.sort_values(column, ascending=False, kind='stable').head(k)
+
+
+# Functions to keep a display table's Arrow conversion in session state,
+# so st.dataframe is handed the same table while its inputs are unchanged
+def get_display_table(name, key):
+    cached = st.session_state.get(name)
+    return cached[1] if cached is not None and cached[0] == key else None
+
+
+def put_display_table(name, key, frame):
+    table = pa.Table.from_pandas(frame, preserve_index=True)
+    st.session_state[name] = (key, table)
+    return table
+
+
+# Load filter options
+all_positions, all_teams, players_by_group = load_filter_options()
 
 # Create sidebar for filters
 with st.sidebar:
     st.sidebar.header("Filters")
     # Position filter
-    all_positions = sorted(df['positionName'].unique())
     st.sidebar.markdown("#### Filter by Position")
     selected_positions = st.sidebar.multiselect(
         "(empty = all)",
@@ -74,7 +442,6 @@ with st.sidebar:
         selected_positions = all_positions
 
     # Team filter
-    all_teams = sorted(df['teamName'].unique())
     st.sidebar.markdown("#### Filter by Team")
     selected_teams = st.sidebar.multiselect(
         "(empty = all)",
@@ -87,14 +454,13 @@ with st.sidebar:
     if not selected_teams:
         selected_teams = all_teams
 
-    # Filter dataframe based on selections
-    filtered_df = df[
-        (df['positionName'].isin(selected_positions)) &
-        (df['teamName'].isin(selected_teams))
-        ]
-
     # Player filter (depends on position and team filters)
-    all_players = sorted(filtered_df['playerName'].unique())
+    all_players = sorted({
+        player
+        for position in selected_positions
+        for team in selected_teams
+        for player in players_by_group.get((position, team), [])
+    })
     st.sidebar.markdown("#### Filter by Player")
     selected_players = st.sidebar.multiselect(
         "(empty = all)",
@@ -103,12 +469,7 @@ with st.sidebar:
         key="players_multiselect"
     )
 
-    # Further filter if players are selected
-    if selected_players:
-        filtered_df = filtered_df[filtered_df['playerName'].isin(selected_players)]
-
     # Stat selection
-    available_stats = ['runs', 'kickPressures', 'kicksDefused', 'supports', 'decoys', 'tackles']
     st.sidebar.markdown("#### Select Effort Stats")
     selected_stats = st.multiselect(
         "Select statistics",
@@ -121,135 +482,46 @@ with st.sidebar:
 if not selected_stats:
     st.warning("Please select at least one statistic to analyze.")
 else:
-    # Calculate the sum of selected stats for each player-round combination
-    filtered_df['efforts'] = filtered_df[selected_stats].sum(axis=1)
-
-    # Calculate player season totals for the selected stats
-    player_season_stats = filtered_df.groupby(['playerName', 'teamName', 'positionName']).agg({
-        'mins': 'sum',
-        'efforts': 'sum',
-        'roundNumber': 'count'
-    }).reset_index()
-    player_season_stats.rename(columns={'roundNumber': 'gamesPlayed', 'mins': 'totalMins'}, inplace=True)
-
-    # Calculate the stats per minute
-    player_season_stats['efforts_per_min'] = (player_season_stats['efforts'] / player_season_stats['totalMins'])
-
-    # Display three plots in tabs
-    plot_tabs = st.tabs(["Individual Games", "Season Total", "Season Efficiency"])
+    # Filter and aggregate (cached on the sorted selections)
+    view_key = (
+        tuple(sorted(selected_positions)),
+        tuple(sorted(selected_teams)),
+        tuple(sorted(selected_players)),
+        tuple(sorted(selected_stats))
+    )
+    filtered_df, player_season_stats = compute_views(*view_key)
+
+    # Display three plots as tab-style views. Only the selected view's figure
+    # is built, unlike st.tabs which runs every tab body on each rerun
+    plot_view = st.radio(
+        "Plot",
+        ["Individual Games", "Season Total", "Season Efficiency"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="plot_view_radio"
+    )
 
     # Construct a descriptive title for the plots
     selected_stats_str = ', '.join(selected_stats)
     title_stats = selected_stats_str if len(selected_stats_str) < 60 else selected_stats_str[:57] + '...'
 
-    with plot_tabs[0]:
+    if plot_view == "Individual Games":
         st.subheader("Game Minutes vs. Efforts")
 
-        # Create the scatter plot
-        fig1 = px.scatter(
-            filtered_df,
-            x='mins',
-            y='efforts',
-            color='positionName',
-            hover_name='playerName',
-            hover_data=['positionName', 'teamName', 'roundNumber', 'mins'],
-            labels={'mins': 'Mins', 'efforts': f'Efforts'}
-        )
-
-        x_max_1 = filtered_df['mins'].max()
-
-        # Add y = x line
-        fig1.add_shape(
-            type="line",
-            x0=0, y0=0,
-            x1=x_max_1, y1=x_max_1,
-            line=dict(color="black", dash="dash"),
-        )
-
-        # Update the layout
-        fig1.update_layout(
-            height=600,
-            xaxis_title="Minutes Played",
-            yaxis_title=f"Number of Efforts",
-            legend_title="Position"
-        )
-
         # Show the plot
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(build_figure(view_key, 'games'), use_container_width=True)
 
-    with plot_tabs[1]:
+    elif plot_view == "Season Total":
         st.subheader("Total Minutes vs. Total Efforts")
 
-        # Create the scatter plot for season totals
-        fig2 = px.scatter(
-            player_season_stats,
-            x='totalMins',
-            y='efforts',
-            color='positionName',
-            hover_name='playerName',
-            hover_data=['teamName', 'gamesPlayed', 'totalMins', 'efforts'],
-            labels={'totalMins': 'Total Mins', 'efforts': f'Total Efforts'},
-            size='gamesPlayed',  # Size points by games played
-            size_max=15  # Maximum marker size
-        )
-
-        x_max_2 = player_season_stats['totalMins'].max()
-
-        # Add y = x line
-        fig2.add_shape(
-            type="line",
-            x0=0, y0=0,
-            x1=x_max_2, y1=x_max_2,
-            line=dict(color="black", dash="dash"),
-        )
-
-        # Update the layout
-        fig2.update_layout(
-            height=600,
-            xaxis_title="Total Minutes Played",
-            yaxis_title=f"Total Efforts",
-            legend_title="Position"
-        )
-
         # Show the plot
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(build_figure(view_key, 'season_total'), use_container_width=True)
 
-    with plot_tabs[2]:
+    elif plot_view == "Season Efficiency":
         st.subheader("Efforts Per Minute")
 
-        # Create the scatter plot for efficiency
-        fig3 = px.scatter(
-            player_season_stats,
-            x='totalMins',
-            y='efforts_per_min',
-            color='positionName',
-            hover_name='playerName',
-            hover_data=['teamName', 'gamesPlayed', 'totalMins', 'efforts', 'efforts_per_min'],
-            labels={'totalMins': 'Total Minutes Played', 'efforts_per_min': f'Efforts per Minute'},
-            size='gamesPlayed',  # Size points by games played
-            size_max=15  # Maximum marker size
-        )
-
-        x_max_3 = player_season_stats['totalMins'].max()
-
-        # Add y = x line
-        fig3.add_shape(
-            type="line",
-            x0=0, y0=1,
-            x1=x_max_3, y1=1,
-            line=dict(color="black", dash="dash"),
-        )
-
-        # Update the layout
-        fig3.update_layout(
-            height=600,
-            xaxis_title="Total Minutes Played",
-            yaxis_title=f"Efforts Per Minute",
-            legend_title="Position"
-        )
-
         # Show the plot
-        st.plotly_chart(fig3, use_container_width=True)
+        st.plotly_chart(build_figure(view_key, 'season_efficiency'), use_container_width=True)
 
     # Display summary statistics
     st.header("Summary Statistics")
@@ -263,11 +535,11 @@ else:
             st.subheader("Top Players by Total Efforts")
 
             # Create a more detailed top players table
-            top_players = player_season_stats.sort_values('efforts', ascending=False).head(10)
+            top_players = top_k(player_season_stats, 'efforts')
 
             # Add rank column
-            top_players = top_players.reset_index(drop=True)
-            top_players.index = top_players.index + 1
+            top_players = top_players.assign(
+                Rank=np.arange(1, len(top_players) + 1)).set_index('Rank')
 
             # Format table for display
             top_players_table = top_players[
@@ -296,11 +568,11 @@ else:
             # Filter players with meaningful playing time (e.g., at least 80 minutes)
             min_mins = 80
             efficient_players = player_season_stats[player_season_stats['totalMins'] >= min_mins]
-            efficient_players = efficient_players.sort_values('efforts_per_min', ascending=False).head(10)
+            efficient_players = top_k(efficient_players, 'efforts_per_min')
 
             # Add rank column
-            efficient_players = efficient_players.reset_index(drop=True)
-            efficient_players.index = efficient_players.index + 1
+            efficient_players = efficient_players.assign(
+                Rank=np.arange(1, len(efficient_players) + 1)).set_index('Rank')
 
             # Format table for display
             efficient_players_table = efficient_players[
@@ -334,30 +606,39 @@ else:
             # Allow searching in the dataframe
             search_term = st.text_input("Search by player name:", key="search_round_data")
 
-            if search_term:
-                filtered_display_df = filtered_df[filtered_df['playerName'].str.contains(search_term, case=False)]
-            else:
-                filtered_display_df = filtered_df
+            # Reuse the Arrow table while the filters, stats and search are unchanged
+            round_key = (view_key, tuple(selected_stats), search_term)
+            round_table = get_display_table('round_data_table', round_key)
 
-            st.dataframe(
-                filtered_display_df[
-                    ['playerName', 'teamName', 'positionName', 'roundNumber', 'mins'] + selected_stats + ['efforts']],
-                use_container_width=True
-            )
+            if round_table is None:
+                if search_term:
+                    filtered_display_df = filtered_df[player_name_contains(filtered_df, search_term)]
+                else:
+                    filtered_display_df = filtered_df
+
+                round_table = put_display_table('round_data_table', round_key, filtered_display_df[
+                    ['playerName', 'teamName', 'positionName', 'roundNumber', 'mins'] + selected_stats + ['efforts']])
+
+            st.dataframe(round_table, use_container_width=True)
 
         with raw_tabs[1]:
             st.subheader("Season Totals")
             # Allow searching in the dataframe
             search_term_season = st.text_input("Search by player name:", key="search_season_data")
 
-            if search_term_season:
-                filtered_season_df = player_season_stats[
-                    player_season_stats['playerName'].str.contains(search_term_season, case=False)]
-            else:
-                filtered_season_df = player_season_stats
-
-            st.dataframe(
-                filtered_season_df[['playerName', 'teamName', 'positionName', 'gamesPlayed', 'totalMins', 'efforts',
-                                    'efforts_per_min']],
-                use_container_width=True
-            )
\ No newline at end of file
+            # Reuse the Arrow table while the filters, stats and search are unchanged
+            season_key = (view_key, search_term_season)
+            season_table = get_display_table('season_data_table', season_key)
+
+            if season_table is None:
+                if search_term_season:
+                    filtered_season_df = player_season_stats[
+                        player_name_contains(player_season_stats, search_term_season)]
+                else:
+                    filtered_season_df = player_season_stats
+
+                season_table = put_display_table('season_data_table', season_key, filtered_season_df[
+                    ['playerName', 'teamName', 'positionName', 'gamesPlayed', 'totalMins', 'efforts',
+                     'efforts_per_min']])
+
+            st.dataframe(season_table, use_container_width=True)
\ No newline at end of file
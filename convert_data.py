@@ -0,0 +1,14 @@
+import pandas as pd
+
+# One-off conversion of the round-by-round player CSV to Parquet.
+# Run this whenever round_players.csv is refreshed: python convert_data.py
+df = pd.read_csv('round_players.csv')
+
+# zstd compression with dictionary-encoded columns (names repeat every round)
+df.to_parquet(
+    'round_players.parquet',
+    engine='pyarrow',
+    compression='zstd',
+    use_dictionary=True,
+    index=False
+)